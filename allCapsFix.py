@@ -2,8 +2,15 @@ import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox
 import json
 import os
+import shutil
+import string
+import tempfile
 import threading
 
+# Byte sets deleted with bytes.translate to count letters in ASCII text
+ASCII_LETTERS = string.ascii_letters.encode('ascii')
+ASCII_UPPERCASE = string.ascii_uppercase.encode('ascii')
+
 def is_mostly_uppercase(text, threshold=0.60):
     """
     Checks if a string is composed of a certain percentage of uppercase letters.
@@ -12,13 +19,26 @@ def is_mostly_uppercase(text, threshold=0.60):
     if not isinstance(text, str) or not text.strip():
         return False
     
-    alpha_chars = [char for char in text if char.isalpha()]
-    if not alpha_chars:
+    if text.isascii():
+        # Fast path: in ASCII only A-Z/a-z are letters, so count them in C by
+        # measuring how many bytes bytes.translate deletes
+        data = text.encode('ascii')
+        alpha_count = len(data) - len(data.translate(None, ASCII_LETTERS))
+        upper_count = len(data) - len(data.translate(None, ASCII_UPPERCASE))
+    else:
+        # Count in a single pass instead of building intermediate lists
+        alpha_count = 0
+        upper_count = 0
+        for char in text:
+            if char.isalpha():
+                alpha_count += 1
+                if char.isupper():
+                    upper_count += 1
+    
+    if not alpha_count:
         return False
-        
-    upper_chars = [char for char in alpha_chars if char.isupper()]
     
-    return len(upper_chars) / len(alpha_chars) >= threshold
+    return upper_count / alpha_count >= threshold
 
 def to_sentence_case(text):
     """
@@ -71,8 +91,11 @@ def process_json_data(data):
             # Check if the current key is 'text' and its value is a string
             if key == 'text' and isinstance(value, str):
                 if is_mostly_uppercase(value):
-                    data[key] = to_sentence_case(value)
-                    modified = True
+                    fixed = to_sentence_case(value)
+                    # Only count real changes so untouched files are not rewritten
+                    if fixed != value:
+                        data[key] = fixed
+                        modified = True
             # If the value is another dict or a list, recurse into it
             elif isinstance(value, (dict, list)):
                 if process_json_data(value):
@@ -86,6 +109,49 @@ def process_json_data(data):
                     modified = True
     return modified
 
+def write_json_atomic(file_path, data):
+    """
+    Writes JSON data to a temporary file and swaps it into place, so an
+    interrupted run never leaves a truncated file behind. Mirrors
+    write_text_atomic in commonMistakeFix.py.
+    """
+    # Serialize in memory first so the file is written in one call
+    # rather than in many small chunks by json.dump
+    content = json.dumps(data, indent=2, ensure_ascii=False)
+    tmp_file = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', delete=False,
+        dir=os.path.dirname(os.path.abspath(file_path)),
+        prefix=os.path.basename(file_path) + ".", suffix=".tmp")
+    try:
+        with tmp_file:
+            tmp_file.write(content)
+        shutil.copymode(file_path, tmp_file.name)
+        os.replace(tmp_file.name, file_path)
+    except Exception:
+        if os.path.exists(tmp_file.name):
+            os.remove(tmp_file.name)
+        raise
+
+def fix_json_file(file_path):
+    """
+    Fixes uppercase text in a single JSON file, rewriting it if needed.
+    Returns a (modified, log_message) tuple.
+    """
+    filename = os.path.basename(file_path)
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if process_json_data(data):
+            write_json_atomic(file_path, data)
+            return True, "  -> MODIFIED: Found and fixed uppercase text."
+        return False, "  -> OK: No changes needed."
+
+    except json.JSONDecodeError:
+        return False, f"  -> ERROR: Could not decode JSON from {filename}."
+    except Exception as e:
+        return False, f"  -> ERROR: An unexpected error occurred with {filename}: {e}"
+
 class JsonFixerApp:
     """A GUI application to fix JSON files in a directory."""
     def __init__(self, root):
@@ -154,31 +220,22 @@ class JsonFixerApp:
         files_processed = 0
         files_modified = 0
         
-        for root_dir, _, files in os.walk(self.directory_path):
-            for filename in files:
-                if filename.endswith(".json"):
-                    file_path = os.path.join(root_dir, filename)
-                    self.log(f"Scanning: {filename}")
-                    files_processed += 1
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        if process_json_data(data):
-                            self.log(f"  -> MODIFIED: Found and fixed uppercase text.")
+        try:
+            for root_dir, _, files in os.walk(self.directory_path):
+                for filename in files:
+                    if filename.endswith(".json"):
+                        self.log(f"Scanning: {filename}")
+                        files_processed += 1
+                        modified, message = fix_json_file(os.path.join(root_dir, filename))
+                        self.log(message)
+                        if modified:
                             files_modified += 1
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                json.dump(data, f, indent=2, ensure_ascii=False)
-                        else:
-                            self.log(f"  -> OK: No changes needed.")
-
-                    except json.JSONDecodeError:
-                        self.log(f"  -> ERROR: Could not decode JSON from {filename}.")
-                    except Exception as e:
-                        self.log(f"  -> ERROR: An unexpected error occurred with {filename}: {e}")
-
-        # Update GUI from the main thread after processing is done
-        self.root.after(0, self.on_processing_complete, files_processed, files_modified)
+        except Exception as e:
+            self.log(f"  -> ERROR: Processing stopped unexpectedly: {e}")
+        finally:
+            # Update GUI from the main thread after processing is done,
+            # even if the scan failed, so the buttons are re-enabled
+            self.root.after(0, self.on_processing_complete, files_processed, files_modified)
 
     def on_processing_complete(self, processed_count, modified_count):
         """Updates the GUI after the background thread is finished."""
@@ -1,6 +1,47 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+import io
 import os
+import re
+import shutil
+import tempfile
+
+def write_text_atomic(file_path, content):
+    """
+    Writes text to a temporary file and swaps it into place, so an
+    interrupted replace never leaves a truncated file behind.
+    """
+    tmp_file = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', delete=False,
+        dir=os.path.dirname(os.path.abspath(file_path)),
+        prefix=os.path.basename(file_path) + ".", suffix=".tmp")
+    try:
+        with tmp_file:
+            tmp_file.write(content)
+        # Keep the original file's permissions
+        shutil.copymode(file_path, tmp_file.name)
+        os.replace(tmp_file.name, file_path)
+    except Exception:
+        if os.path.exists(tmp_file.name):
+            os.remove(tmp_file.name)
+        raise
+
+class LiteralPattern:
+    """
+    A case-sensitive stand-in for a compiled pattern that uses plain string
+    methods, so exact matches never go through the regex engine.
+    """
+    def __init__(self, find_str):
+        self.find_str = find_str
+
+    def search(self, text):
+        return self.find_str in text
+
+    def subn(self, replacement, text):
+        count = text.count(self.find_str)
+        if count:
+            text = text.replace(self.find_str, replacement)
+        return text, count
 
 class FindReplaceApp:
     """
@@ -22,6 +63,8 @@ class FindReplaceApp:
         self.file_extension = tk.StringVar(value=".txt")
         self.case_sensitive = tk.BooleanVar(value=False)  # Default to case-insensitive
         self.preview_data = [] # To store data for actual replacement
+        self.find_pattern = None # Compiled during preview and reused for replacement
+        self.replacement = ""
 
         # --- UI Configuration ---
         self.root.columnconfigure(0, weight=1)
@@ -184,6 +227,15 @@ class FindReplaceApp:
         for data_item in self.preview_data:
             data_item["included"] = False
 
+    def _compile_find_pattern(self, find_str, replace_str, case_sensitive):
+        """
+        Builds the find pattern and matching replacement once per run, honoring the case sensitivity setting.
+        """
+        if case_sensitive:
+            return LiteralPattern(find_str), replace_str
+        # Escape backslashes so the replacement is inserted literally
+        return re.compile(re.escape(find_str), re.IGNORECASE), replace_str.replace('\\', r'\\')
+
     def _preview_changes(self):
         """
         Finds occurrences of the text and displays them in the preview pane.
@@ -210,6 +262,11 @@ class FindReplaceApp:
             ext = '.' + ext
             self.file_extension.set(ext)
 
+        find_pattern, replacement = self._compile_find_pattern(find_str, self.replace_text.get(), case_sensitive)
+        # Keep both for Replace All so it applies exactly what was previewed
+        self.find_pattern = find_pattern
+        self.replacement = replacement
+
         self.status_label.config(text="Searching for files...")
         self.root.update_idletasks() # Force UI update
 
@@ -222,52 +279,34 @@ class FindReplaceApp:
                         file_path = os.path.join(root_dir, file)
                         try:
                             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                for line_num, line in enumerate(f, 1):
-                                    # Only process lines that contain "text": (case-insensitive)
-                                    if '"text":' not in line.lower():
-                                        continue
-                                    
-                                    # Check for match based on case sensitivity setting
-                                    if case_sensitive:
-                                        line_contains_text = find_str in line
-                                    else:
-                                        line_contains_text = find_str.lower() in line.lower()
+                                content = f.read()
+                            
+                            # Skip the per-line scan for files that never contain the find text
+                            if not find_pattern.search(content):
+                                continue
+                            
+                            # Iterate the decoded content rather than reading the file again
+                            for line_num, line in enumerate(io.StringIO(content), 1):
+                                # Only process lines that contain "text": (case-insensitive)
+                                if '"text":' not in line.lower():
+                                    continue
+                                
+                                # Find and replace all occurrences in a single scan of the line
+                                new_line, count = find_pattern.subn(replacement, line)
+                                
+                                if count:
+                                    # Store data for replacement and display
+                                    self.preview_data.append({
+                                        "path": file_path,
+                                        "line_num": line_num,
+                                        "original_line": line,
+                                        "new_line": new_line,
+                                        "included": True  # Default to included
+                                    })
                                     
-                                    if line_contains_text:
-                                        # Find all occurrences and replace them
-                                        new_line = line
-                                        start = 0
-                                        while True:
-                                            if case_sensitive:
-                                                pos = new_line.find(find_str, start)
-                                            else:
-                                                pos = new_line.lower().find(find_str.lower(), start)
-                                            
-                                            if pos == -1:
-                                                break
-                                            
-                                            # Replace the actual case found in the file
-                                            if case_sensitive:
-                                                new_line = new_line[:pos] + self.replace_text.get() + new_line[pos + len(find_str):]
-                                            else:
-                                                # For case-insensitive, we need to replace the exact text found
-                                                actual_text = new_line[pos:pos + len(find_str)]
-                                                new_line = new_line[:pos] + self.replace_text.get() + new_line[pos + len(find_str):]
-                                            
-                                            start = pos + len(self.replace_text.get())
-                                        
-                                        # Store data for replacement and display
-                                        self.preview_data.append({
-                                            "path": file_path,
-                                            "line_num": line_num,
-                                            "original_line": line,
-                                            "new_line": new_line,
-                                            "included": True  # Default to included
-                                        })
-                                        
-                                        # Insert into Treeview with checkbox (✓ for checked)
-                                        item_id = self.tree.insert("", "end", values=("✓", file, line_num, line.strip(), new_line.strip()))
-                                        found_count += 1
+                                    # Insert into Treeview with checkbox (✓ for checked)
+                                    item_id = self.tree.insert("", "end", values=("✓", file, line_num, line.strip(), new_line.strip()))
+                                    found_count += 1
                         except Exception as e:
                             print(f"Could not read file {file_path}: {e}")
             
@@ -309,9 +348,9 @@ class FindReplaceApp:
                 files_to_change[file_path] = []
             files_to_change[file_path].append(item)
         
-        find_str = self.find_text.get()
-        replace_str = self.replace_text.get()
-        case_sensitive = self.case_sensitive.get()
+        # Reuse the pattern compiled for the preview instead of rebuilding it
+        find_pattern = self.find_pattern
+        replacement = self.replacement
         files_changed_count = 0
         total_replacements = 0
 
@@ -334,29 +373,15 @@ class FindReplaceApp:
                             current_line = lines[line_num - 1]  # Convert to 0-based index
                             
                             # Perform replacement on this line based on case sensitivity
-                            new_line = current_line
-                            start = 0
-                            while True:
-                                if case_sensitive:
-                                    pos = new_line.find(find_str, start)
-                                else:
-                                    pos = new_line.lower().find(find_str.lower(), start)
-                                
-                                if pos == -1:
-                                    break
-                                
-                                # Replace the text
-                                new_line = new_line[:pos] + replace_str + new_line[pos + len(find_str):]
-                                start = pos + len(replace_str)
-                                replacements_made += 1
+                            new_line, count = find_pattern.subn(replacement, current_line)
+                            replacements_made += count
                             
                             lines[line_num - 1] = new_line
                     
                     # Only write file if changes were made
                     new_content = ''.join(lines)
                     if new_content != original_content:
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(new_content)
+                        write_text_atomic(file_path, new_content)
                         files_changed_count += 1
                         total_replacements += replacements_made
                         
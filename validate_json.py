@@ -13,8 +13,41 @@ Supported structures:
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
+
+# Required segment fields for each structure as (field, allowed types,
+# description used in error messages), built once at import
+VOICELINE_SEGMENT_SCHEMA = (
+    ("start", (int, float), "a number"),
+    ("end", (int, float), "a number"),
+    ("text", str, "a string"),
+    ("part", int, "an integer"),
+)
+SIMPLE_SEGMENT_SCHEMA = VOICELINE_SEGMENT_SCHEMA[:3]
+
+
+def validate_segments(segments: List, schema: Tuple) -> Optional[str]:
+    """
+    Checks every segment against a segment schema.
+    
+    Returns:
+        An error message for the first invalid segment, or None if all are valid
+    """
+    for idx, segment in enumerate(segments):
+        if not isinstance(segment, dict):
+            return f"Segment {idx} must be a dictionary"
+        
+        for field, _, _ in schema:
+            if field not in segment:
+                return f"Segment {idx} missing required field '{field}'"
+        
+        for field, types, description in schema:
+            if not isinstance(segment[field], types):
+                return f"Segment {idx} '{field}' must be {description}"
+    
+    return None
 
 
 def is_valid_voiceline(data: Dict) -> Tuple[bool, str]:
@@ -53,26 +86,9 @@ def is_valid_voiceline(data: Dict) -> Tuple[bool, str]:
     if not isinstance(data["segments"], list):
         return False, "'segments' must be a list"
     
-    for idx, segment in enumerate(data["segments"]):
-        if not isinstance(segment, dict):
-            return False, f"Segment {idx} must be a dictionary"
-        
-        required_fields = ["start", "end", "text", "part"]
-        for field in required_fields:
-            if field not in segment:
-                return False, f"Segment {idx} missing required field '{field}'"
-        
-        if not isinstance(segment["start"], (int, float)):
-            return False, f"Segment {idx} 'start' must be a number"
-        
-        if not isinstance(segment["end"], (int, float)):
-            return False, f"Segment {idx} 'end' must be a number"
-        
-        if not isinstance(segment["text"], str):
-            return False, f"Segment {idx} 'text' must be a string"
-        
-        if not isinstance(segment["part"], int):
-            return False, f"Segment {idx} 'part' must be an integer"
+    error = validate_segments(data["segments"], VOICELINE_SEGMENT_SCHEMA)
+    if error:
+        return False, error
     
     return True, "Valid voiceline structure"
 
@@ -105,28 +121,14 @@ def is_valid_simple_file(data: Dict) -> Tuple[bool, str]:
     if not isinstance(data["segments"], list):
         return False, "'segments' must be a list"
     
-    for idx, segment in enumerate(data["segments"]):
-        if not isinstance(segment, dict):
-            return False, f"Segment {idx} must be a dictionary"
-        
-        required_fields = ["start", "end", "text"]
-        for field in required_fields:
-            if field not in segment:
-                return False, f"Segment {idx} missing required field '{field}'"
-        
-        if not isinstance(segment["start"], (int, float)):
-            return False, f"Segment {idx} 'start' must be a number"
-        
-        if not isinstance(segment["end"], (int, float)):
-            return False, f"Segment {idx} 'end' must be a number"
-        
-        if not isinstance(segment["text"], str):
-            return False, f"Segment {idx} 'text' must be a string"
+    error = validate_segments(data["segments"], SIMPLE_SEGMENT_SCHEMA)
+    if error:
+        return False, error
     
     return True, "Valid simple file structure"
 
 
-def validate_json_file(file_path: Path) -> Tuple[bool, str]:
+def validate_json_file(file_path: Union[str, Path]) -> Tuple[bool, str]:
     """
     Validates a single JSON file against all known structures.
     
@@ -164,19 +166,30 @@ def validate_all_json_files(data_dir: Path) -> Tuple[int, int, List[Tuple[str, s
         Tuple of (total_files, valid_files, errors)
         where errors is a list of (filename, error_message) tuples
     """
-    if not data_dir.exists():
+    if not data_dir.is_dir():
         print(f"Error: Directory {data_dir} does not exist")
         return 0, 0, []
     
-    json_files = list(data_dir.glob("*.json"))
+    # A single scandir pass yields names and plain string paths, which are
+    # cheaper to build and to send to worker processes than Path objects
+    with os.scandir(data_dir) as entries:
+        json_files = [entry for entry in entries if entry.name.endswith(".json")]
     total_files = len(json_files)
     valid_files = 0
     errors = []
     
     print(f"Validating {total_files} JSON files in {data_dir}...")
     
-    for json_file in json_files:
-        is_valid, message = validate_json_file(json_file)
+    file_paths = [json_file.path for json_file in json_files]
+    if (os.cpu_count() or 1) > 1:
+        # Files are independent, so spread them across worker processes
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(validate_json_file, file_paths, chunksize=256))
+    else:
+        # A pool only adds startup and pickling overhead on a single core
+        results = [validate_json_file(file_path) for file_path in file_paths]
+    
+    for json_file, (is_valid, message) in zip(json_files, results):
         if is_valid:
             valid_files += 1
         else: